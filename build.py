@@ -2,6 +2,7 @@
 Build script para EpubToMP3 TTS
 Genera un ejecutable único en la carpeta dist/
 """
+import asyncio
 import subprocess
 import sys
 import shutil
@@ -51,6 +52,9 @@ def build():
     for mod in hidden_imports:
         cmd += ["--hidden-import", mod]
 
+    # Metadatos de edge-tts: la app lee su versión con importlib.metadata para validar la caché de voces
+    cmd += ["--copy-metadata", "edge-tts"]
+
     # Incluir datos de customtkinter (temas/assets)
     try:
         import customtkinter
@@ -78,6 +82,23 @@ def build():
         print()
 
 
+    # Incluir una instantánea de la lista de voces edge-tts (la caché local, descargándola
+    # si todavía no existe) para que el primer arranque no dependa de la red
+    from modules.utils.voice_manager import VOICES_CACHE_FILE, VoiceManager
+    if not VOICES_CACHE_FILE.exists():
+        print("[info] Descargando la lista de voces edge-tts...")
+        try:
+            asyncio.run(VoiceManager().load_voices_async())
+        except Exception as e:
+            print(f"[aviso] No se pudo descargar la lista de voces: {e}")
+    if VOICES_CACHE_FILE.exists():
+        cmd += ["--add-data", f"{VOICES_CACHE_FILE};modules/utils/"]
+        print(f"[info] Se incluira la lista de voces en cache: {VOICES_CACHE_FILE}")
+    else:
+        print(f"\n[aviso] No existe {VOICES_CACHE_FILE}: el EXE no incluira la lista de voces")
+        print("[aviso] y necesitara conexion en el primer arranque para obtenerla.")
+        print()
+
     cmd.append(ENTRY_POINT)
 
     print("\n[build] Ejecutando PyInstaller...")
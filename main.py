@@ -1,11 +1,3 @@
-import os
-import tkinter as tk
-import asyncio
-import threading
-from pathlib import Path
-
-import customtkinter as ctk
-
 from modules.gui.app import TextToSpeechApp
 from modules.utils.voice_manager import VoiceManager
 from modules.utils.piper_manager import PiperVoiceManager
@@ -1,12 +1,10 @@
 import asyncio
 import os
 import re
-import tempfile
-from typing import Optional, Callable, List, Dict, Any
-import edge_tts
+import shutil
+from typing import Optional, Callable, List
 
 from modules.utils.voice_manager import VoiceManager
-from modules.extractors import get_extractor
 
 class AudioConverter:
     def __init__(self, voice_manager: VoiceManager, piper_manager=None, chatterbox_manager=None, kokoro_manager=None):
@@ -19,6 +17,8 @@ class AudioConverter:
         self.is_paused = False
         self.is_cancelled = False
         self.current_process = None
+        # Number of convert_text_to_speech calls in flight (chapters may run concurrently)
+        self._active_conversions = 0
         
     async def convert_text_to_speech(
         self,
@@ -44,9 +44,12 @@ class AudioConverter:
             
         if not voice_name:
             raise ValueError("No se ha seleccionado una voz")
+        # Only a fresh run resets pause/cancel; concurrent chapter runs share them
+        if not self._active_conversions:
+            self.is_paused = False
+            self.is_cancelled = False
+        self._active_conversions += 1
         self.is_processing = True
-        self.is_paused = False
-        self.is_cancelled = False
         
         temp_files = []
         temp_dir = None
@@ -57,6 +60,8 @@ class AudioConverter:
             if self.engine_mode in ["offline", "chatterbox", "kokoro"]:
                 voice = {"Name": voice_name}
             else:
+                # Imported once per call here (not per fragment); startup doesn't need edge_tts
+                import edge_tts
                 voice = self.voice_manager.get_voice_by_name(voice_name)
                 if not voice:
                     raise ValueError(f"Voz no encontrada: {voice_name}")
@@ -248,7 +253,9 @@ class AudioConverter:
             raise
             
         finally:
-            self.is_processing = False
+            self._active_conversions -= 1
+            if not self._active_conversions:
+                self.is_processing = False
             # Solo limpiamos los fragmentos si la conversión de este lote fue completamente exitosa
             if success:
                 self._cleanup_temp_files(temp_files)
@@ -282,6 +289,7 @@ class AudioConverter:
                 output_path = f"{base}{suffix}{ext}"
 
             # Get the extractor for the input file type
+            from modules.extractors import get_extractor
             extractor = get_extractor(input_path)
             
             # Extract text or chapters
@@ -390,6 +398,7 @@ class AudioConverter:
                 os.makedirs(output_dir)
             
             # Generate TTS
+            import edge_tts
             communicate = edge_tts.Communicate(
                 text,
                 voice_name,
@@ -477,8 +486,6 @@ class AudioConverter:
 
     def _encode_wav_output(self, wav_path: str, output_path: str, output_format: str):
         """Encode a locally generated WAV without silently mislabeling files."""
-        import shutil
-
         output_format = self._normalise_output_format(output_format)
         if output_format == "wav":
             shutil.copy2(wav_path, output_path)
@@ -501,47 +508,58 @@ class AudioConverter:
 
         output_format = os.path.splitext(output_file)[1].lower().lstrip(".")
 
-        if output_format == "wav":
-            import wave
-            with wave.open(output_file, "wb") as outfile:
-                for i, fname in enumerate(input_files):
-                    try:
-                        with wave.open(fname, "rb") as infile:
-                            if i == 0:
-                                outfile.setparams(infile.getparams())
-                            outfile.writeframes(infile.readframes(infile.getnframes()))
-                    except Exception as e:
-                        print(f"Warning: Could not read {fname}: {e}")
-        elif output_format == "flac":
-            # FLAC debe combinarse como audio decodificado; concatenar bytes
-            # produciría un archivo inválido con varias cabeceras FLAC.
-            import soundfile as sf
-            with sf.SoundFile(input_files[0], "r") as first:
-                with sf.SoundFile(
-                    output_file,
-                    "w",
-                    samplerate=first.samplerate,
-                    channels=first.channels,
-                    format="FLAC",
-                ) as outfile:
+        # Write to a sibling ".part" file and rename on success so a crash or
+        # cancellation never leaves a truncated output behind
+        tmp_file = output_file + ".part"
+        try:
+            if output_format == "wav":
+                import wave
+                with wave.open(tmp_file, "wb") as outfile:
+                    for i, fname in enumerate(input_files):
+                        try:
+                            with wave.open(fname, "rb") as infile:
+                                if i == 0:
+                                    outfile.setparams(infile.getparams())
+                                outfile.writeframes(infile.readframes(infile.getnframes()))
+                        except Exception as e:
+                            print(f"Warning: Could not read {fname}: {e}")
+            elif output_format == "flac":
+                # FLAC debe combinarse como audio decodificado; concatenar bytes
+                # produciría un archivo inválido con varias cabeceras FLAC.
+                import soundfile as sf
+                with sf.SoundFile(input_files[0], "r") as first:
+                    with sf.SoundFile(
+                        tmp_file,
+                        "w",
+                        samplerate=first.samplerate,
+                        channels=first.channels,
+                        format="FLAC",
+                    ) as outfile:
+                        for fname in input_files:
+                            with sf.SoundFile(fname, "r") as infile:
+                                if (infile.samplerate, infile.channels) != (first.samplerate, first.channels):
+                                    raise ValueError("Los fragmentos tienen distintas propiedades de audio")
+                                while True:
+                                    data = infile.read(65536, dtype="float32")
+                                    if len(data) == 0:
+                                        break
+                                    outfile.write(data)
+            else:
+                # Los fragmentos MP3 de edge-tts se pueden concatenar directamente.
+                with open(tmp_file, "wb", buffering=1 << 20) as outfile:
                     for fname in input_files:
-                        with sf.SoundFile(fname, "r") as infile:
-                            if (infile.samplerate, infile.channels) != (first.samplerate, first.channels):
-                                raise ValueError("Los fragmentos tienen distintas propiedades de audio")
-                            while True:
-                                data = infile.read(65536, dtype="float32")
-                                if len(data) == 0:
-                                    break
-                                outfile.write(data)
-        else:
-            # Los fragmentos MP3 de edge-tts se pueden concatenar directamente.
-            with open(output_file, "wb") as outfile:
-                for fname in input_files:
-                    try:
-                        with open(fname, "rb") as infile:
-                            outfile.write(infile.read())
-                    except Exception as e:
-                        print(f"Warning: Could not read {fname}: {e}")
+                        try:
+                            with open(fname, "rb") as infile:
+                                shutil.copyfileobj(infile, outfile, 1 << 20)
+                        except Exception as e:
+                            print(f"Warning: Could not read {fname}: {e}")
+                    outfile.flush()
+                    os.fsync(outfile.fileno())
+            os.replace(tmp_file, output_file)
+        except Exception:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            raise
     
     def _cleanup_temp_files(self, files: List[str]):
         """Clean up temporary files"""
@@ -10,11 +10,14 @@ EXTRACTORS: List[Type[BaseExtractor]] = [
     EPUBExtractor
 ]
 
+# Extension -> extractor class, derived from EXTRACTORS for O(1) dispatch in get_extractor
+_EXTRACTORS_BY_EXT: Dict[str, Type[BaseExtractor]] = {
+    ext: extractor_cls for extractor_cls in EXTRACTORS for ext in extractor_cls.EXTENSIONS
+}
+
 def get_extractor(file_path: str) -> Optional[BaseExtractor]:
     """Get the appropriate extractor for the given file"""
-    for extractor_cls in EXTRACTORS:
-        if extractor_cls.supports_file(file_path):
-            return extractor_cls()
-    return None
+    extractor_cls = _EXTRACTORS_BY_EXT.get(os.path.splitext(str(file_path))[1].lower())
+    return extractor_cls() if extractor_cls else None
 
 __all__ = ['BaseExtractor', 'PDFExtractor', 'EPUBExtractor', 'get_extractor']
@@ -1,11 +1,13 @@
 import re
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any, Union
-import asyncio
+from typing import List, Optional, Dict, Any, Union, Tuple
 
 class BaseExtractor(ABC):
     """Base class for all text extractors"""
     
+    # Lower-case file extensions handled by the extractor (used by get_extractor)
+    EXTENSIONS: Tuple[str, ...] = ()
+    
     @abstractmethod
     async def extract_text(self, file_path: str) -> Union[str, List[Dict[str, Any]]]:
         """Extract text from the file
@@ -1,10 +1,9 @@
 import os
 import re
 import zipfile
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional
 import xml.etree.ElementTree as ET
 from bs4 import BeautifulSoup
-import asyncio
 import urllib.parse
 
 from .base import BaseExtractor
@@ -12,6 +11,8 @@ from .base import BaseExtractor
 class EPUBExtractor(BaseExtractor):
     """Extracts text from EPUB files with chapter support"""
     
+    EXTENSIONS = ('.epub',)
+    
     def __init__(self):
         self.container_path = "META-INF/container.xml"
         self.root_dir = ""
@@ -439,4 +440,4 @@ class EPUBExtractor(BaseExtractor):
     @classmethod
     def supports_file(cls, file_path: str) -> bool:
         """Check if the file is an EPUB"""
-        return str(file_path).lower().endswith('.epub')
+        return str(file_path).lower().endswith(cls.EXTENSIONS)
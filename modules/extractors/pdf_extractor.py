@@ -1,13 +1,14 @@
 import re
 import PyPDF2
-from typing import List, Optional, Tuple, Dict, Any
-import asyncio
+from typing import List
 
 from .base import BaseExtractor
 
 class PDFExtractor(BaseExtractor):
     """Extracts text from PDF files with chapter support"""
     
+    EXTENSIONS = ('.pdf',)
+    
     # Common chapter patterns in PDFs
     CHAPTER_PATTERNS = [
         r'^\s*chapter\s+\d+',  # Chapter 1, Chapter 2, etc.
@@ -96,43 +97,45 @@ class PDFExtractor(BaseExtractor):
     async def extract_chapter(self, file_path: str, chapter_index: int) -> str:
         """Extract text for a specific chapter"""
         try:
-            # If we haven't found chapters yet, get them now
-            if not self.chapter_titles:
+            # If we haven't scanned the document yet, do it now (this also fills page_texts)
+            if not self.page_texts:
                 await self.get_chapters(file_path)
             
-            with open(file_path, 'rb') as file:
-                reader = PyPDF2.PdfReader(file)
-                text_parts = []
-                
-                if not self.chapter_titles:
-                    # If still no chapters, treat each page as a chapter
-                    if 0 <= chapter_index < len(reader.pages):
-                        page = reader.pages[chapter_index]
-                        return page.extract_text() or ""
-                    return ""
-                
-                # Get start and end pages for the chapter
-                start_page = self.chapter_pages[chapter_index]
-                if chapter_index + 1 < len(self.chapter_pages):
-                    end_page = self.chapter_pages[chapter_index + 1]
-                else:
-                    end_page = len(reader.pages)
-                
-                # Extract text for the chapter
-                for i in range(start_page, end_page):
-                    page = reader.pages[i]
-                    page_text = page.extract_text()
-                    if page_text:
-                        # For the first page, only include text after the chapter title
-                        if i == start_page:
-                            lines = page_text.split('\n')
-                            for j, line in enumerate(lines):
-                                if line.strip() == self.chapter_titles[chapter_index].strip():
-                                    page_text = '\n'.join(lines[j+1:])
-                                    break
-                        text_parts.append(page_text)
-                
-                return '\n\n'.join(text_parts)
+            # Reuse the page texts extracted by get_chapters instead of reparsing the PDF per chapter
+            if not self.page_texts:
+                with open(file_path, 'rb') as file:
+                    reader = PyPDF2.PdfReader(file)
+                    self.page_texts = [page.extract_text() or "" for page in reader.pages]
+            page_texts = self.page_texts
+            text_parts = []
+            
+            if not self.chapter_titles:
+                # If still no chapters, treat each page as a chapter
+                if 0 <= chapter_index < len(page_texts):
+                    return page_texts[chapter_index]
+                return ""
+            
+            # Get start and end pages for the chapter
+            start_page = self.chapter_pages[chapter_index]
+            if chapter_index + 1 < len(self.chapter_pages):
+                end_page = self.chapter_pages[chapter_index + 1]
+            else:
+                end_page = len(page_texts)
+            
+            # Extract text for the chapter
+            for i in range(start_page, end_page):
+                page_text = page_texts[i]
+                if page_text:
+                    # For the first page, only include text after the chapter title
+                    if i == start_page:
+                        lines = page_text.split('\n')
+                        for j, line in enumerate(lines):
+                            if line.strip() == self.chapter_titles[chapter_index].strip():
+                                page_text = '\n'.join(lines[j+1:])
+                                break
+                    text_parts.append(page_text)
+            
+            return '\n\n'.join(text_parts)
                 
         except Exception as e:
             raise Exception(f"Error extracting chapter {chapter_index}: {str(e)}")
@@ -164,4 +167,4 @@ class PDFExtractor(BaseExtractor):
     @classmethod
     def supports_file(cls, file_path: str) -> bool:
         """Check if the file is a PDF"""
-        return str(file_path).lower().endswith('.pdf')
+        return str(file_path).lower().endswith(cls.EXTENSIONS)
@@ -3,18 +3,38 @@ import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import asyncio
 import threading
-from pathlib import Path
-from typing import Optional, Callable, Dict, Any, List, Set
+import concurrent.futures
+import importlib
+from functools import partial
+from typing import Optional, Callable, Dict, Any, List
 
 import customtkinter as ctk
 
 from modules.utils.voice_manager import VoiceManager
 from modules.conversion.converter import AudioConverter
-from modules.extractors import get_extractor
 
 
+# File dialog filters, built once
+BOOK_FILETYPES = (
+    ("Archivos soportados", "*.pdf *.epub"),
+    ("Archivos PDF", "*.pdf"),
+    ("Archivos EPUB", "*.epub"),
+)
+AUDIO_FILETYPES = (
+    ("Archivos de audio", "*.wav *.mp3"),
+    ("Archivos WAV", "*.wav"),
+    ("Archivos MP3", "*.mp3"),
+)
+
 
 class TextToSpeechApp(ctk.CTk):
+    # Chapters synthesized at the same time with edge-tts; each one already fans out
+    # into several concurrent fragment requests inside AudioConverter. Local engines
+    # (Piper, Chatterbox, Kokoro) share one model and run a chapter at a time.
+    MAX_PARALLEL_CHAPTERS = 2
+    # Minimum time between progress repaints during a conversion (10 Hz)
+    PROGRESS_FLUSH_MS = 100
+
     def __init__(self, voice_manager: VoiceManager, audio_converter: AudioConverter, piper_manager=None, chatterbox_manager=None, kokoro_manager=None):
         super().__init__()
         
@@ -33,8 +53,23 @@ class TextToSpeechApp(ctk.CTk):
         self.output_files_created: List[str] = []
         self.output_format_var = tk.StringVar(value="MP3 — comprimido (~0.5–1.5 MB/min)")
         self.is_processing = False
-        self.conversion_thread: Optional[threading.Thread] = None
+        self._conv_future: Optional[concurrent.futures.Future] = None
+        self._cancel_confirm_job: Optional[str] = None  # after() id while a cancel awaits confirmation
+        # Completion toast, created on first use, and its pending auto-hide
+        self._toast: Optional[ctk.CTkLabel] = None
+        self._toast_job: Optional[str] = None
+        # One asyncio loop on a background thread shared by every coroutine the GUI runs
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, name="asyncio-loop", daemon=True).start()
         self.selected_chapters: Optional[List[int]] = None
+        self.chapters_data: List[Dict[str, Any]] = []
+        # Extractor and extracted content for the current input file, set on file selection
+        self._extractor = None
+        self._content_cache: Optional[tuple] = None  # ((input_file, mtime_ns), extract_text result)
+        self._chapters_future: Optional[concurrent.futures.Future] = None  # in-flight chapter load
+        # (language, gender) last applied to the voice dropdown
+        self._last_voice_filter: Optional[tuple] = None
+        self._shown_voices: tuple = ()  # names last passed to the voice dropdown
         
         # Engine mode: 'online' | 'offline'
         self.engine_mode = tk.StringVar(value="online")
@@ -45,6 +80,10 @@ class TextToSpeechApp(ctk.CTk):
         self.total_chapters = 0
         self.total_characters = 0
         self.processed_characters = 0
+        # Latest progress_callback arguments and whether a UI flush is already scheduled
+        self._last_progress = (0, 1, 0, 0, 0)
+        self._progress_pending = False
+        self._progress_job: Optional[str] = None  # after() id of the scheduled _flush_progress
         
         # Configure grid
         self.grid_columnconfigure(0, weight=1)
@@ -52,25 +91,82 @@ class TextToSpeechApp(ctk.CTk):
         
         self.setup_ui()
         self.load_voices_async()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        
+        # Warm up the extractors (PyPDF2, BeautifulSoup) while the user browses the UI
+        threading.Thread(target=importlib.import_module, args=("modules.extractors",), daemon=True).start()
+
+    def _on_close(self):
+        """Stop any pending conversion and the background loop before closing"""
+        self.audio_converter.cancel()
+        if self._conv_future:
+            self._conv_future.cancel()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self.destroy()
+
+    def _ui(self, fn: Callable, *args, **kwargs):
+        """Run a Tk call on the main thread; use it for every UI mutation made from workers"""
+        self.after(0, partial(fn, *args, **kwargs))
+
+    def _run_async(self, coro) -> concurrent.futures.Future:
+        """Submit a coroutine to the shared background event loop"""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+    
+    @staticmethod
+    def _file_key(path: str) -> tuple:
+        """Cache key for extracted content: the path plus its modification time"""
+        return (path, os.stat(path).st_mtime_ns)
+    
+    @staticmethod
+    async def _off_loop(coro):
+        """Await a CPU-bound coroutine (extractor parsing) on a worker thread
 
+        The extractors are async in name only; running them directly would stall
+        every other task on the shared loop (TTS requests, voice loading).
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, TextToSpeechApp._run_await_free, coro)
+    
+    @staticmethod
+    def _run_await_free(coro):
+        """Drive a coroutine that never suspends to completion, without an event loop"""
+        try:
+            coro.send(None)
+        except StopIteration as done:
+            return done.value
+        coro.close()
+        raise RuntimeError("El extractor intentó suspenderse fuera del bucle de eventos")
     
     def load_voices_async(self):
-        """Load voices in a background thread to keep the UI responsive"""
-        def run_async():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        """Load voices on the background event loop to keep the UI responsive"""
+        # A fresh on-disk cache makes the list available immediately, with no network round-trip
+        if self.voice_manager.load_cached_voices():
+            self.update_voice_filters()
+            return
+        
+        # Otherwise show an outdated cache or the bundled snapshot right away and refresh in the background
+        refresh = self.voice_manager.load_cached_voices(max_age=None) or self.voice_manager.load_bundled_voices()
+        if refresh:
+            self.update_voice_filters()
+        else:
+            # Nothing to show yet: the network fetch below runs on the background loop
+            # (start_conversion refuses the online engine until it finishes)
+            self._set_status("Cargando voces...")
+        
+        def on_done(fut):
             try:
-                # This will load the voices into the voice manager
-                loop.run_until_complete(self.voice_manager.load_voices_async())
-                # Update the UI on the main thread
-                self.after(100, self.update_voice_filters)
+                fut.result()
             except Exception as e:
                 print(f"Error loading voices: {str(e)}")
-            finally:
-                loop.close()
+                if not refresh:
+                    self._ui(self._set_status, "No se pudieron cargar las voces online")
+                return
+            if not refresh and not self.is_processing:
+                self._ui(self._set_status, "Listo")
+            # Update the UI on the main thread; the voice list changed, so drop the cached filter
+            self._last_voice_filter = None
+            self.after(100, self.update_voice_filters)
         
-        # Start the voice loading in a separate thread
-        threading.Thread(target=run_async, daemon=True).start()
+        self._run_async(self.voice_manager.load_voices_async(refresh=refresh)).add_done_callback(on_done)
     
     def setup_ui(self):
         # Configure window background
@@ -498,8 +594,21 @@ class TextToSpeechApp(ctk.CTk):
             corner_radius=6, command=self._deselect_all_chapters
         ).pack(side=tk.LEFT, padx=2)
         
-        self.chapter_scroll_frame = ctk.CTkScrollableFrame(self.chapter_container, height=180, fg_color="#0F172A", corner_radius=8)
-        self.chapter_scroll_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=(0, 15))
+        # A single native Listbox scales to thousands of chapters, unlike one checkbox widget per row
+        list_frame = ctk.CTkFrame(self.chapter_container, fg_color="#0F172A", corner_radius=8)
+        list_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=(0, 15))
+        
+        self.chapter_listbox = tk.Listbox(
+            list_frame, selectmode=tk.MULTIPLE, activestyle="none", exportselection=False,
+            height=9, bg="#0F172A", fg="#E2E8F0", selectbackground="#4F46E5", selectforeground="#FFFFFF",
+            highlightthickness=0, borderwidth=0, font=("Segoe UI", 11)
+        )
+        self.chapter_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(8, 0), pady=8)
+        self.chapter_listbox.bind("<<ListboxSelect>>", self._on_chapter_selection_changed)
+        
+        chapter_scrollbar = ctk.CTkScrollbar(list_frame, command=self.chapter_listbox.yview)
+        chapter_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=8)
+        self.chapter_listbox.configure(yscrollcommand=chapter_scrollbar.set)
 
         # ── Card 4: Progress & Controls (row 7) ──────────────────────────────────
         progress_card = ctk.CTkFrame(
@@ -628,9 +737,13 @@ class TextToSpeechApp(ctk.CTk):
         self.char_label.pack(fill=tk.X, pady=2)
 
         # ── Status bar (row 8) ──────────────────────────────────────────────────
-        self.status_var = tk.StringVar(value="Listo")
+        # Plain Python string instead of a StringVar: writers only store the text and
+        # the label is refreshed by _flush_status at most ~30 times per second
+        self._status_text = "Listo"
+        self._status_shown = self._status_text
+        self._status_flush_pending = False
         self.status_bar = ctk.CTkLabel(
-            self.main_frame, textvariable=self.status_var, anchor="w", height=20,
+            self.main_frame, text=self._status_text, anchor="w", height=20,
             font=ctk.CTkFont(family="Segoe UI", size=11), text_color="#64748B"
         )
         self.status_bar.grid(row=8, column=0, padx=5, pady=(5, 0), sticky="ew")
@@ -706,8 +819,7 @@ class TextToSpeechApp(ctk.CTk):
         self.online_panel.grid_remove()
         self.offline_panel.grid_remove()
         self.chatterbox_panel.grid_remove()
-        if hasattr(self, 'kokoro_panel'):
-            self.kokoro_panel.grid_remove()
+        self.kokoro_panel.grid_remove()
 
         # Update button styles dynamically
         self._update_engine_button_styles()
@@ -801,12 +913,7 @@ class TextToSpeechApp(ctk.CTk):
 
     def _browse_ref_audio(self):
         """Busca el archivo de audio de referencia para clonación."""
-        filetypes = [
-            ("Archivos de audio", "*.wav *.mp3"),
-            ("Archivos WAV", "*.wav"),
-            ("Archivos MP3", "*.mp3")
-        ]
-        filename = filedialog.askopenfilename(filetypes=filetypes)
+        filename = filedialog.askopenfilename(filetypes=AUDIO_FILETYPES, multiple=False)
         if filename:
             self.cb_ref_audio_entry.delete(0, tk.END)
             self.cb_ref_audio_entry.insert(0, filename)
@@ -883,22 +990,17 @@ class TextToSpeechApp(ctk.CTk):
         webbrowser.open("https://github.com/HectorZL")
     
     def on_language_changed(self, event=None):
-        """Update voice list when language changes"""
-        self.update_voice_filters()
-        
-        # Update gender options based on selected language
+        """Update gender options and the voice list when language changes"""
         selected_lang = self.lang_var.get()
         lang_code = 'es' if selected_lang == 'Español' else 'en'
         
-        # Get available genders for the selected language
-        self.voice_manager._filter_voices(languages={lang_code})
-        available_genders = self.voice_manager.get_available_genders()
+        # Get available genders for the selected language (read-only lookup)
+        available_genders = self.voice_manager.available_genders_for(lang_code)
         
         # Update gender combobox
         self.gender_dropdown['values'] = ['Todos'] + available_genders
         self.gender_dropdown.set('Todos')
         
-        # Update voices
         self.update_voice_filters()
     
     def on_gender_changed(self, event=None):
@@ -916,12 +1018,20 @@ class TextToSpeechApp(ctk.CTk):
         if selected_gender == 'todos':
             selected_gender = None
         
-        # Update filters
-        self.voice_manager.update_filters(language=lang_code, gender=selected_gender)
+        # Skip the rebuild (and combobox relayout) when nothing changed
+        key = (lang_code, selected_gender)
+        if key == self._last_voice_filter:
+            return
+        self._last_voice_filter = key
         
-        # Update voice combobox
+        # Update filters (a lookup in the manager's precomputed index)
+        self.voice_manager.update_filters(language=lang_code, gender=selected_gender)
         voices = self.voice_manager.get_voice_names()
-        self.voice_dropdown.configure(values=voices)
+        
+        # Update voice combobox (skipped when it already shows exactly these voices)
+        if tuple(voices) != self._shown_voices:
+            self._shown_voices = tuple(voices)
+            self.voice_dropdown.configure(values=voices)
         
         # Try to keep the same voice if possible
         if voices and (self.voice_var.get() not in voices or not self.voice_var.get()):
@@ -930,99 +1040,91 @@ class TextToSpeechApp(ctk.CTk):
             self.voice_var.set("")
     
     def load_file_chapters(self):
-        """Extract chapters and their character counts in a background thread"""
+        """Extract chapters and their character counts on the background loop"""
         if not self.input_file:
             return
             
         self.chapter_toggle_btn.configure(state=tk.DISABLED, text="Cargando capítulos...")
         
-        # Clear existing checkboxes in the scroll frame
-        for child in self.chapter_scroll_frame.winfo_children():
-            child.destroy()
+        # Clear the existing chapter list
+        self.chapter_listbox.delete(0, tk.END)
+        
+        extractor = self._extractor
+        if not extractor:
+            self.chapter_toggle_btn.configure(text="Formato no soportado")
+            return
             
-        def _bg_load():
+        def on_done(fut):
             try:
-                import asyncio
-                extractor = get_extractor(self.input_file)
-                if not extractor:
-                    self.after(0, lambda: self.chapter_toggle_btn.configure(text="Formato no soportado"))
-                    return
-                
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                content = loop.run_until_complete(extractor.extract_text(self.input_file))
-                loop.close()
-                
-                # Format chapters list with character counts
-                chapters_data = []
-                if isinstance(content, list):
-                    for i, chap in enumerate(content):
-                        title = chap.get('title', f"Capítulo {i+1}") if isinstance(chap, dict) else str(chap)
-                        text = chap.get('content', '') if isinstance(chap, dict) else str(chap)
-                        chapters_data.append({
-                            'index': i,
-                            'title': title,
-                            'chars': len(text)
-                        })
-                else:
-                    # PDF or plain text
-                    loop2 = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop2)
-                    titles = loop2.run_until_complete(extractor.get_chapters(self.input_file))
-                    loop2.close()
-                    for i, title in enumerate(titles):
-                        loop3 = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop3)
-                        chap_text = loop3.run_until_complete(extractor.extract_chapter(self.input_file, i))
-                        loop3.close()
-                        chapters_data.append({
-                            'index': i,
-                            'title': title,
-                            'chars': len(chap_text) if chap_text else 0
-                        })
-                
-                self.after(0, lambda data=chapters_data: self._on_chapters_loaded(data))
+                chapters_data = fut.result()
             except Exception as e:
                 print(f"Error loading chapters: {e}")
-                self.after(0, lambda: self.chapter_toggle_btn.configure(text="Error al cargar capítulos"))
+                self._ui(self.chapter_toggle_btn.configure, text="Error al cargar capítulos")
+                return
+            self._ui(self._on_chapters_loaded, chapters_data)
 
-        threading.Thread(target=_bg_load, daemon=True).start()
+        self._chapters_future = self._run_async(self._collect_chapters_data(extractor, self.input_file))
+        self._chapters_future.add_done_callback(on_done)
+
+    async def _collect_chapters_data(self, extractor, input_file: str) -> List[Dict[str, Any]]:
+        """Build the (index, title, chars) list shown in the chapter panel"""
+        key = self._file_key(input_file)
+        content = await self._off_loop(extractor.extract_text(input_file))
+        self._content_cache = (key, content)
+        
+        # Format chapters list with character counts
+        chapters_data = []
+        if isinstance(content, list):
+            for i, chap in enumerate(content):
+                title = chap.get('title', f"Capítulo {i+1}") if isinstance(chap, dict) else str(chap)
+                text = chap.get('content', '') if isinstance(chap, dict) else str(chap)
+                chapters_data.append({
+                    'index': i,
+                    'title': title,
+                    'chars': len(text)
+                })
+        else:
+            # PDF or plain text: detecting and extracting chapters parses the file again, off the loop
+            async def collect_pdf_chapters():
+                titles = await extractor.get_chapters(input_file)
+                for i, title in enumerate(titles):
+                    chap_text = await extractor.extract_chapter(input_file, i)
+                    chapters_data.append({
+                        'index': i,
+                        'title': title,
+                        'chars': len(chap_text) if chap_text else 0
+                    })
+            await self._off_loop(collect_pdf_chapters())
+        return chapters_data
 
     def _on_chapters_loaded(self, chapters_data):
         """Populate the chapter container inside the main window"""
         self.chapters_data = chapters_data
         
-        self.chapter_checkboxes = []
-        self.chapter_vars = []
+        # Build every label first and hand them to Tk in one insert call
+        labels = [self._format_chapter_label(ch) for ch in chapters_data]
+        if labels:
+            self.chapter_listbox.insert(tk.END, *labels)
         
-        for ch in chapters_data:
-            var = tk.BooleanVar(value=True)
-            self.chapter_vars.append(var)
-            
-            # Format text: "Cap. X: Title (1,234 chars)"
-            title_truncated = ch['title'][:50] + "..." if len(ch['title']) > 50 else ch['title']
-            display_text = f"Cap. {ch['index']+1}: {title_truncated} ({ch['chars']:,} caract.)"
-            
-            cb = ctk.CTkCheckBox(
-                self.chapter_scroll_frame,
-                text=display_text,
-                variable=var,
-                command=self._on_chapter_selection_changed
-            )
-            cb.pack(anchor="w", pady=3, padx=5)
-            self.chapter_checkboxes.append(cb)
+        # Everything starts selected
+        self.chapter_listbox.selection_set(0, tk.END)
             
         # Enable toggle button and update text
         self.selected_chapters = list(range(len(chapters_data)))
         self.chapter_toggle_btn.configure(state=tk.NORMAL)
         self._update_chapter_toggle_btn_text()
 
-    def _on_chapter_selection_changed(self):
-        """Called when a checkbox is toggled"""
-        selected = []
-        for i, var in enumerate(self.chapter_vars):
-            if var.get():
-                selected.append(i)
+    @staticmethod
+    def _format_chapter_label(ch: Dict[str, Any]) -> str:
+        """Format a chapter row as "Cap. X: Title (1,234 caract.)" for the list"""
+        title = str(ch['title'])
+        if len(title) > 50:
+            title = title[:50] + "..."
+        return f"Cap. {ch['index']+1}: {title} ({ch['chars']:,} caract.)"
+
+    def _on_chapter_selection_changed(self, event=None):
+        """Called when a chapter is toggled in the list"""
+        selected = list(self.chapter_listbox.curselection())
                 
         if len(selected) == len(self.chapters_data):
             self.selected_chapters = list(range(len(self.chapters_data)))  # All selected
@@ -1034,7 +1136,7 @@ class TextToSpeechApp(ctk.CTk):
         self._update_chapter_toggle_btn_text()
 
     def _update_chapter_toggle_btn_text(self):
-        if not hasattr(self, 'chapters_data') or not self.chapters_data:
+        if not self.chapters_data:
             self.chapter_toggle_btn.configure(text="📖 Seleccionar Capítulos (No hay archivo)")
             return
             
@@ -1062,18 +1164,16 @@ class TextToSpeechApp(ctk.CTk):
         self._update_chapter_toggle_btn_text()
 
     def _select_all_chapters(self):
-        if not hasattr(self, 'chapter_vars'):
+        if not self.chapters_data:
             return
-        for var in self.chapter_vars:
-            var.set(True)
+        self.chapter_listbox.selection_set(0, tk.END)
         self.selected_chapters = list(range(len(self.chapters_data)))
         self._update_chapter_toggle_btn_text()
         
     def _deselect_all_chapters(self):
-        if not hasattr(self, 'chapter_vars'):
+        if not self.chapters_data:
             return
-        for var in self.chapter_vars:
-            var.set(False)
+        self.chapter_listbox.selection_clear(0, tk.END)
         self.selected_chapters = []
         self._update_chapter_toggle_btn_text()
     
@@ -1106,18 +1206,17 @@ class TextToSpeechApp(ctk.CTk):
 
     def browse_file(self):
         """Open file dialog to select input file"""
-        filetypes = [
-            ("Archivos soportados", "*.pdf *.epub"),
-            ("Archivos PDF", "*.pdf"),
-            ("Archivos EPUB", "*.epub")
-        ]
-        
-        filename = filedialog.askopenfilename(filetypes=filetypes)
+        filename = filedialog.askopenfilename(filetypes=BOOK_FILETYPES, multiple=False)
         if filename:
             self.input_file = filename
             self.file_entry.delete(0, tk.END)
             self.file_entry.insert(0, filename)
             
+            # Resolve the extractor once per file; drop anything cached for the previous one
+            from modules.extractors import get_extractor
+            self._extractor = get_extractor(filename)
+            self._content_cache = None
+            
             # Load chapters and populate collapsible panel
             self.selected_chapters = None
             self.chapter_container.grid_remove()
@@ -1125,16 +1224,44 @@ class TextToSpeechApp(ctk.CTk):
             
             # Set default output filename
             output_format = self._get_output_format()
-            output_name = f"{Path(filename).stem}.{output_format}"
-            self.output_file = str(Path(filename).parent / output_name)
+            stem = os.path.splitext(os.path.basename(filename))[0]
+            self.output_file = os.path.join(os.path.dirname(filename), f"{stem}.{output_format}")
     
     def cancel_conversion(self):
-        """Cancel the current conversion"""
-        if messagebox.askyesno("Confirmar", "¿Estás seguro de que deseas cancelar la conversión?"):
-            self.audio_converter.cancel()
-            self.is_processing = False
-            self.update_ui_state()
-            self.status_var.set("Conversión cancelada")
+        """Cancel the current conversion (a second click within 5 s confirms it)"""
+        # Non-modal confirmation: a blocking dialog would freeze progress updates meanwhile
+        if self.is_processing and self._cancel_confirm_job is None:
+            # Stop submitting new fragments right away; in-flight ones finish while the user decides
+            self.audio_converter.pause()
+            self.cancel_btn.configure(text="⚠️ ¿Confirmar cancelación?")
+            self._set_status("Pulsa de nuevo Cancelar para confirmar")
+            self._cancel_confirm_job = self.after(5000, self._abort_cancel)
+            return
+        if not self.is_processing:
+            return
+        self._clear_cancel_confirm()
+        self.audio_converter.cancel()
+        if self._conv_future:
+            self._conv_future.cancel()
+        self.is_processing = False
+        self._cancel_progress_flush()
+        self.update_ui_state()
+        self._set_status("Conversión cancelada")
+    
+    def _clear_cancel_confirm(self):
+        """Drop a pending cancel confirmation and restore the button label"""
+        if self._cancel_confirm_job is not None:
+            self.after_cancel(self._cancel_confirm_job)
+            self._cancel_confirm_job = None
+            self.cancel_btn.configure(text="🛑 Cancelar")
+    
+    def _abort_cancel(self):
+        """Cancellation was not confirmed in time: resume the conversion"""
+        self._cancel_confirm_job = None
+        self.cancel_btn.configure(text="🛑 Cancelar")
+        self.audio_converter.resume()
+        if self.is_processing:
+            self._set_status("Conversión reanudada")
     
     def start_conversion(self):
         """Start the conversion process"""
@@ -1188,6 +1315,9 @@ class TextToSpeechApp(ctk.CTk):
                 messagebox.showerror("Error", "Por favor seleccione una voz de Kokoro.")
                 return
         else:
+            if not self.voice_manager.loaded:
+                messagebox.showerror("Error", "Las voces online todavía se están cargando")
+                return
             selected_voice = self.voice_var.get()
             if not selected_voice:
                 messagebox.showerror("Error", "Por favor seleccione una voz")
@@ -1196,14 +1326,13 @@ class TextToSpeechApp(ctk.CTk):
         self.is_processing = True
         self.update_ui_state()
         self.progress_bar.set(0)
-        self.status_var.set("Extrayendo texto...")
+        self._set_status("Extrayendo texto...")
 
-        # Start conversion in a background thread
-        self.conversion_thread = threading.Thread(
-            target=self.run_conversion,
-            daemon=True
+        # Run the conversion directly on the shared event loop (no extra threads)
+        self._conv_future = self._run_async(
+            self._convert_file(self.input_file, self.output_file, selected_voice)
         )
-        self.conversion_thread.start()
+        self._conv_future.add_done_callback(self._on_conversion_done)
     
     def update_ui_state(self):
         """Update UI elements based on current state"""
@@ -1216,10 +1345,8 @@ class TextToSpeechApp(ctk.CTk):
             self.gender_dropdown.configure(state=tk.DISABLED)
             self.chapter_toggle_btn.configure(state=tk.DISABLED)
             self.cancel_btn.configure(state=tk.NORMAL)  # Enable cancel button during processing
-            if hasattr(self, 'join_checkbox'):
-                self.join_checkbox.configure(state=tk.DISABLED)
-            if hasattr(self, 'keep_checkbox'):
-                self.keep_checkbox.configure(state=tk.DISABLED)
+            self.join_checkbox.configure(state=tk.DISABLED)
+            self.keep_checkbox.configure(state=tk.DISABLED)
         else:
             self.convert_btn.configure(state=tk.NORMAL)
             self.browse_btn.configure(state=tk.NORMAL)
@@ -1229,242 +1356,180 @@ class TextToSpeechApp(ctk.CTk):
             self.gender_dropdown.configure(state="readonly")
             self.chapter_toggle_btn.configure(state=tk.NORMAL if self.input_file else tk.DISABLED)
             self.cancel_btn.configure(state=tk.NORMAL)  # Keep cancel button enabled by default
-            if hasattr(self, 'join_checkbox'):
-                self.join_checkbox.configure(state=tk.NORMAL)
-            if hasattr(self, 'keep_checkbox'):
-                if self.join_chapters_var.get():
-                    self.keep_checkbox.configure(state=tk.NORMAL)
-                else:
-                    self.keep_checkbox.configure(state=tk.DISABLED)
-    
-    def run_conversion(self):
-        """Run the conversion process in a background thread"""
-        try:
-            if not self.input_file or not self.output_file:
-                return
-
-            # Get the selected voice (depends on engine mode)
-            if self.engine_mode.get() == "offline":
-                voice_name = self.piper_voice_var.get()
-            elif self.engine_mode.get() == "chatterbox":
-                voice_mode = self.cb_voice_mode_var.get()
-                if voice_mode == "Voz Predeterminada":
-                    voice_name = "default"
-                else:
-                    voice_name = self.cb_ref_audio_entry.get().strip()
-            elif self.engine_mode.get() == "kokoro":
-                voice_name = self.kokoro_voice_var.get()
+            self.join_checkbox.configure(state=tk.NORMAL)
+            if self.join_chapters_var.get():
+                self.keep_checkbox.configure(state=tk.NORMAL)
             else:
-                voice_name = self.voice_var.get()
-
-            if not voice_name:
-                messagebox.showerror("Error", "Por favor seleccione una voz")
-                return
-
-            # Update UI for conversion start
-            self.is_processing = True
-            self.update_ui_state()
-            self.status_var.set("Procesando...")
-            self.progress_bar.set(0)
-
-            # Create a thread for the conversion
-            self.conversion_thread = threading.Thread(
-                target=self._run_conversion_thread,
-                args=(self.input_file, self.output_file, voice_name)
-            )
-            self.conversion_thread.daemon = True
-            self.conversion_thread.start()
-            
-        except Exception as e:
-            self.is_processing = False
-            self.update_ui_state()
-            messagebox.showerror("Error", f"Error al iniciar la conversión: {str(e)}")
+                self.keep_checkbox.configure(state=tk.DISABLED)
     
-    def _run_conversion_thread(self, input_file: str, output_file: str, voice_name: str):
-        """Run the actual conversion in a separate thread"""
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        try:
-            # Run the conversion
-            loop.run_until_complete(self._convert_file(
-                input_file, output_file, voice_name
-            ))
-            
-            # Update UI on success
-            self.after(0, self.on_conversion_complete)
-            
-        except Exception as error:
-            # Store the error in a variable to avoid scoping issues
-            error_msg = str(error)
+    def _on_conversion_done(self, fut: concurrent.futures.Future):
+        """Hand the conversion outcome back to the Tk thread (runs on the loop thread)"""
+        if fut.cancelled():
+            return
+        error = fut.exception()
+        if error is None:
+            # Queued behind the progress updates already posted, so on_conversion_complete
+            # sees (and drops) the last scheduled flush
+            self._ui(self.on_conversion_complete)
+        else:
             # Update UI on error
-            self.after(0, lambda e=error_msg: self.on_conversion_error(e))
-            
-        finally:
-            loop.close()
+            self._ui(self.on_conversion_error, str(error))
     
     async def _convert_file(self, input_file: str, output_file: str, voice_name: str):
         """Convert the file using the audio converter"""
         try:
             output_format = self._get_output_format()
             self.output_files_created = []
-            if hasattr(self, 'selected_chapters') and self.selected_chapters:
-                chap_numbers = [idx + 1 for idx in self.selected_chapters]
+            # Snapshot of the chapter selection (None = whole book as a single file)
+            selected = self.selected_chapters
+            if selected:
+                chap_numbers = [idx + 1 for idx in selected]
                 min_chap = min(chap_numbers)
                 max_chap = max(chap_numbers)
                 suffix = f"_{min_chap}_{max_chap}" if min_chap != max_chap else f"_{min_chap}"
                 base, ext = os.path.splitext(output_file)
                 output_file = f"{base}{suffix}{ext}"
 
-            # Reset progress tracking at start of conversion
-            self.after(0, self.reset_ui_state)
+            # Reset progress tracking at start of conversion (controls stay locked)
+            self._ui(self._reset_progress)
             
-            # Get the extractor for the file type
-            extractor = get_extractor(input_file)
+            # Get the extractor for the file type (cached on file selection)
+            extractor = self._extractor
+            if not extractor:
+                from modules.extractors import get_extractor
+                extractor = get_extractor(input_file)
             if not extractor:
                 raise ValueError("Formato de archivo no soportado")
             
-            # Get the chapters or full content
-            content = await extractor.extract_text(input_file)
+            # A chapter load still in flight shares the extractor and fills the cache: let it finish first
+            chapters_future = self._chapters_future
+            if chapters_future and not chapters_future.done():
+                try:
+                    await asyncio.shield(asyncio.wrap_future(chapters_future))
+                except Exception:
+                    pass  # Its failure is reported by the chapter panel; extract below instead
+            
+            # Reuse the text already extracted (chapter panel or a previous run) unless the file changed
+            key = self._file_key(input_file)
+            if self._content_cache and self._content_cache[0] == key:
+                content = self._content_cache[1]
+            else:
+                # Parse from the path: the libraries stream the file themselves
+                content = await self._off_loop(extractor.extract_text(input_file))
+                self._content_cache = (key, content)
             
             if not content:
                 raise ValueError("No se pudo extraer contenido del archivo")
             
-            # Calculate total chapters and characters
+            # Calculate total chapters and characters (each chapter's text is resolved once)
             if isinstance(content, list):
-                self.total_chapters = len(content)
-                total_chars = sum(
-                    len(chapter.get('content', '') if isinstance(chapter, dict) else str(chapter))
+                chapter_texts = [
+                    chapter.get('content', '') if isinstance(chapter, dict) else str(chapter)
                     for chapter in content
-                )
-                self.after(0, lambda: self.update_progress_ui(total_chapters=self.total_chapters, total_chars=total_chars))
+                ]
+                self.total_chapters = len(content)
+                total_chars = sum(map(len, chapter_texts))
+                self._ui(self.update_progress_ui, self.total_chapters, total_chars)
             else:
                 total_chars = len(content)
-                self.after(0, lambda: self.update_progress_ui(total_chars=total_chars))
+                self._ui(self.update_progress_ui, 0, total_chars)
             
             # Handle both string and chapter-based content
-            if isinstance(content, str) or not hasattr(self, 'selected_chapters') or self.selected_chapters is None:
+            if isinstance(content, str) or selected is None:
                 # Single file conversion - combine all content
                 if isinstance(content, list):
-                    combined_content = '\n\n'.join(
-                        chapter.get('content', '') if isinstance(chapter, dict) else str(chapter)
-                        for chapter in content
-                    )
-                    total_chars = sum(
-                        len(chapter.get('content', '') if isinstance(chapter, dict) else str(chapter))
-                        for chapter in content
-                    )
+                    combined_content = '\n\n'.join(chapter_texts)
                 else:
                     combined_content = content
-                    total_chars = len(combined_content)
                 
                 # Update total characters
-                self.after(0, lambda: self.progress_callback(0, 1, 0, total_chars, 1))
+                self._ui(self.progress_callback, 0, 1, 0, total_chars, 1)
                 
                 await self.audio_converter.convert_text_to_speech(
                     combined_content,
                     voice_name,
                     output_file,
                     output_format=output_format,
-                    progress_callback=lambda current, total, chars=0, total_chars=total_chars: 
-                        self.progress_callback(
-                            current/total if total > 0 else 0, 
-                            1, 
-                            int((current/total) * total_chars) if total > 0 else 0, 
-                            total_chars,
-                            1
-                        )
+                    progress_callback=partial(self._text_progress, total_chars)
                 )
                 self.output_files_created = [output_file]
             elif isinstance(content, list) and content:
                 # Chapter-based conversion - process each chapter separately
-                # Filter chapters if selection exists
-                if hasattr(self, 'selected_chapters') and self.selected_chapters is not None:
-                    content = [content[i] for i in self.selected_chapters 
-                             if 0 <= i < len(content)]
-                    self.total_chapters = len(content)
-                    total_chars = sum(
-                        len(chapter.get('content', '') if isinstance(chapter, dict) else str(chapter))
-                        for chapter in content
-                    )
-                    self.after(0, lambda: self.update_progress_ui(total_chapters=self.total_chapters, total_chars=total_chars))
+                # Keep only the selected chapters
+                indices = [i for i in selected if 0 <= i < len(content)]
+                content = [content[i] for i in indices]
+                chapter_texts = [chapter_texts[i] for i in indices]
+                self.total_chapters = len(content)
+                total_chars = sum(map(len, chapter_texts))
+                self._ui(self.update_progress_ui, self.total_chapters, total_chars)
                 
                 self.current_chapter = 0
                 
-                # Convert each chapter
-                chapter_files = []
-                for i, chapter in enumerate(content):
-                    self.current_chapter = i + 1
-                    
+                # Convert chapters concurrently (bounded), keeping the output order for joining
+                chapter_outputs: List[Optional[str]] = [None] * len(content)
+                chapter_done_chars = [0] * len(content)
+                done_chars = 0
+                done_chapters = 0
+                online = self.audio_converter.engine_mode == "online"
+                sem = asyncio.Semaphore(self.MAX_PARALLEL_CHAPTERS if online else 1)
+                base, ext = os.path.splitext(output_file)
+                
+                def report(i: int, chapter_chars: int, current: int, total: int):
+                    """Fold one chapter's fragment progress into the overall character count"""
+                    nonlocal done_chars
+                    chars = current * chapter_chars // total if total > 0 else 0
+                    done_chars += chars - chapter_done_chars[i]
+                    chapter_done_chars[i] = chars
+                    self._ui(
+                        self.progress_callback,
+                        done_chapters + (current / total if total > 0 else 0),
+                        len(content),
+                        done_chars,
+                        total_chars,
+                        done_chapters + 1
+                    )
+                
+                async def convert_chapter(i: int, chapter):
+                    nonlocal done_chapters
                     # Get chapter content and character count
-                    chapter_content = chapter.get('content', '') if isinstance(chapter, dict) else str(chapter)
+                    chapter_content = chapter_texts[i]
                     
                     # Skip empty chapters to prevent ValueError crashes
                     if not chapter_content or not chapter_content.strip():
                         print(f"Saltando capítulo vacío {i+1}: {chapter.get('title', 'Sin título') if isinstance(chapter, dict) else 'Capítulo ' + str(i+1)}")
-                        processed_before = sum(
-                            len(c.get('content', '') if isinstance(c, dict) else str(c))
-                            for c in content[:i]
-                        )
-                        self.after(0, lambda i=i, total=len(content), current_chars=processed_before: 
-                            self.progress_callback(
-                                i + 1, 
-                                total,
-                                current_chars,
-                                total_chars,
-                                i + 1
-                            )
-                        )
-                        continue
-                        
-                    chapter_chars = len(chapter_content)
+                        done_chapters += 1
+                        return
                     
-                    # Update progress for new chapter
-                    processed_before = sum(
-                        len(c.get('content', '') if isinstance(c, dict) else str(c))
-                        for c in content[:i]
-                    )
-                    self.after(0, lambda i=i, total=len(content), current_chars=processed_before: 
-                        self.progress_callback(
-                            i, 
-                            total,
-                            current_chars,
-                            total_chars,
-                            i + 1
-                        )
-                    )
+                    chapter_chars = len(chapter_content)
                     
                     # Create output filename for chapter using the original chapter number
-                    base, ext = os.path.splitext(output_file)
-                    # Get the original chapter number from selected_chapters if available
-                    chapter_num = self.selected_chapters[i] + 1 if hasattr(self, 'selected_chapters') and self.selected_chapters else (i + 1)
+                    chapter_num = indices[i] + 1
                     chapter_output = f"{base}_capitulo{chapter_num:02d}{ext}"
                     
                     # Convert this chapter
-                    processed_before = sum(
-                        len(c.get('content', '') if isinstance(c, dict) else str(c))
-                        for c in content[:i]
-                    )
-                    await self.audio_converter.convert_text_to_speech(
-                        chapter_content,
-                        voice_name,
-                        chapter_output,
-                        output_format=output_format,
-                        progress_callback=lambda current, total, i=i, chapter_chars=chapter_chars, 
-                            processed_before=processed_before: 
-                            self.progress_callback(
-                                i + (current/total if total > 0 else 0), 
-                                len(content),
-                                processed_before + int((current/total) * chapter_chars) if total > 0 else 0,
-                                total_chars,
-                                i + 1
-                            )
-                    )
-                    chapter_files.append(chapter_output)
+                    async with sem:
+                        await self.audio_converter.convert_text_to_speech(
+                            chapter_content,
+                            voice_name,
+                            chapter_output,
+                            output_format=output_format,
+                            progress_callback=partial(report, i, chapter_chars)
+                        )
+                    done_chapters += 1
+                    chapter_outputs[i] = chapter_output
+                
+                tasks = [asyncio.ensure_future(convert_chapter(i, chapter)) for i, chapter in enumerate(content)]
+                try:
+                    await asyncio.gather(*tasks)
+                except Exception:
+                    for task in tasks:
+                        task.cancel()
+                    raise
+                chapter_files = [f for f in chapter_outputs if f]
                 
                 # Merge chapters if requested
                 if self.join_chapters_var.get() and chapter_files:
-                    self.after(0, lambda: self.status_var.set("Uniendo capítulos..."))
+                    self._ui(self._set_status, "Uniendo capítulos...")
                     self.audio_converter._combine_audio_files(chapter_files, output_file)
                     
                     if not self.keep_chapters_var.get():
@@ -1480,6 +1545,13 @@ class TextToSpeechApp(ctk.CTk):
         except Exception as e:
             raise Exception(f"Error en la conversión: {str(e)}")
     
+    def _text_progress(self, total_chars: int, current: int, total: int):
+        """Progress hook for single-file conversions (bound with functools.partial)"""
+        if total > 0:
+            self._ui(self.progress_callback, current / total, 1, current * total_chars // total, total_chars, 1)
+        else:
+            self._ui(self.progress_callback, 0, 1, 0, total_chars, 1)
+    
     def update_progress_ui(self, total_chapters=0, total_chars=0):
         """Update the progress UI with total information"""
         if total_chapters > 0:
@@ -1491,50 +1563,79 @@ class TextToSpeechApp(ctk.CTk):
             self.char_label.configure(text=f"Caracteres: 0/{total_chars:,} (0%)")
     
     def progress_callback(self, current: float, total: int, current_chars: int = 0, total_chars: int = 0, chapter: int = 0):
-        """Update progress bar and status with detailed information"""
-        # Ensure we're updating the UI in the main thread
-        def update_ui():
-            try:
-                # Update progress bar based on characters if available, otherwise use chapter progress
-                if total_chars > 0 and current_chars > 0:
-                    progress = current_chars / total_chars
-                    self.progress_bar.set(progress)
-                    
-                    # Update character information
-                    self.processed_characters = current_chars
-                    self.total_characters = total_chars
-                    percent = (current_chars / total_chars * 100) if total_chars > 0 else 0
-                    self.char_label.configure(
-                        text=f"Caracteres: {current_chars:,}/{total_chars:,} ({percent:.1f}%)"
-                    )
-                    
-                    # Update chapter information based on character progress
-                    if hasattr(self, 'total_chapters') and self.total_chapters > 0:
-                        # Calculate current chapter based on character progress
-                        if total > 0:
-                            chapter_progress = current / total
-                            current_chapter = min(self.total_chapters, max(1, int(chapter_progress * self.total_chapters) + 1))
-                            self.current_chapter = current_chapter
-                            self.chapter_label.configure(text=f"Capítulo: {self.current_chapter}/{self.total_chapters}")
+        """Record the latest progress and schedule a coalesced UI refresh (at most every PROGRESS_FLUSH_MS)
+
+        Tk thread only (workers post it through _ui), so the pending flag and after() id have one owner.
+        """
+        self._last_progress = (current, total, current_chars, total_chars, chapter)
+        if not self._progress_pending:
+            self._progress_pending = True
+            # Schedule the UI update on the main thread
+            self._progress_job = self.after(self.PROGRESS_FLUSH_MS, self._flush_progress)
+
+    def _cancel_progress_flush(self):
+        """Drop a scheduled progress flush so it can't overwrite the final status"""
+        if self._progress_job is not None:
+            self.after_cancel(self._progress_job)
+            self._progress_job = None
+        self._progress_pending = False
+
+    def _flush_progress(self):
+        """Update progress bar and status with the most recent progress values"""
+        # Clear the flag before reading so an update arriving meanwhile schedules a new flush
+        self._progress_pending = False
+        self._progress_job = None
+        if not self.is_processing:
+            return
+        current, total, current_chars, total_chars, chapter = self._last_progress
+        try:
+            # Update progress bar based on characters if available, otherwise use chapter progress
+            if total_chars > 0 and current_chars > 0:
+                progress = current_chars / total_chars
+                self.progress_bar.set(progress)
                 
-                # Update status
-                if hasattr(self, 'status_var'):
-                    if hasattr(self, 'total_chapters') and self.total_chapters > 0:
-                        self.status_var.set(
-                            f"Procesando capítulo {self.current_chapter} de {self.total_chapters}... "
-                            f"({self.processed_characters:,}/{self.total_characters:,} caracteres)"
-                        )
-                    else:
-                        self.status_var.set(f"Procesando... {int(current)} de {int(total)}")
-                        
-                # Force update the UI
-                self.update_idletasks()
+                # Update character information
+                self.processed_characters = current_chars
+                self.total_characters = total_chars
+                percent = (current_chars / total_chars * 100) if total_chars > 0 else 0
+                self.char_label.configure(
+                    text=f"Caracteres: {current_chars:,}/{total_chars:,} ({percent:.1f}%)"
+                )
                 
-            except Exception as e:
-                print(f"Error updating UI: {e}")
-        
-        # Schedule the UI update on the main thread
-        self.after(0, update_ui)
+                # Update chapter information based on character progress
+                if self.total_chapters > 0:
+                    # Calculate current chapter based on character progress
+                    if total > 0:
+                        chapter_progress = current / total
+                        current_chapter = min(self.total_chapters, max(1, int(chapter_progress * self.total_chapters) + 1))
+                        self.current_chapter = current_chapter
+                        self.chapter_label.configure(text=f"Capítulo: {self.current_chapter}/{self.total_chapters}")
+            
+            # Update status
+            if self.total_chapters > 0:
+                self._set_status(
+                    f"Procesando capítulo {self.current_chapter} de {self.total_chapters}... "
+                    f"({self.processed_characters:,}/{self.total_characters:,} caracteres)"
+                )
+            else:
+                self._set_status(f"Procesando... {int(current)} de {int(total)}")
+            
+        except Exception as e:
+            print(f"Error updating UI: {e}")
+
+    def _set_status(self, text: str):
+        """Store the status text and schedule a coalesced refresh of the status bar"""
+        self._status_text = text
+        if not self._status_flush_pending:
+            self._status_flush_pending = True
+            self.after(33, self._flush_status)
+
+    def _flush_status(self):
+        """Push the latest status text to the label, skipping redundant redraws"""
+        self._status_flush_pending = False
+        if self._status_text != self._status_shown:
+            self._status_shown = self._status_text
+            self.status_bar.configure(text=self._status_text)
 
     def toggle_detailed_progress(self):
         """Toggle the visibility of the detailed progress section"""
@@ -1548,20 +1649,27 @@ class TextToSpeechApp(ctk.CTk):
 
     def reset_ui_state(self):
         """Reset the UI to its initial state"""
-        self.progress_bar.set(0)
-        self.status_var.set("Listo")
+        self._reset_progress()
+        self._set_status("Listo")
+        self.is_processing = False
+        self.update_ui_state()
+
+    def _reset_progress(self):
+        """Zero the progress counters and widgets, leaving the controls' state alone"""
         self.current_chapter = 0
         self.total_chapters = 0
         self.processed_characters = 0
         self.total_characters = 0
+        self.progress_bar.set(0)
         self.chapter_label.configure(text="Capítulo: 0/0")
         self.char_label.configure(text="Caracteres: 0/0 (0%)")
-        self.is_processing = False
-        self.conversion_thread = None
-        self.update_ui_state()
 
     def on_conversion_complete(self):
         """Handle successful conversion and report the generated file size."""
+        self._cancel_progress_flush()
+        self._clear_cancel_confirm()
+        # Nothing left to cancel while the success message is shown; reset_ui_state re-enables it
+        self.cancel_btn.configure(state=tk.DISABLED)
         self.progress_bar.set(1.0)
         generated_files = [
             path for path in self.output_files_created
@@ -1572,21 +1680,43 @@ class TextToSpeechApp(ctk.CTk):
             size_text = self._format_file_size(total_size)
             count_text = "archivo" if len(generated_files) == 1 else "archivos"
             detail = f"\nTamaño total: {size_text} ({len(generated_files)} {count_text})"
-            self.status_var.set(f"¡Conversión completada! Tamaño: {size_text}")
+            self._set_status(f"¡Conversión completada! Tamaño: {size_text}")
         else:
             detail = ""
-            self.status_var.set("¡Conversión completada con éxito!")
+            self._set_status("¡Conversión completada con éxito!")
 
-        messagebox.showinfo(
-            "Éxito",
-            f"La conversión se ha completado correctamente.{detail}"
-        )
+        # In-window toast instead of a modal dialog, so the event loop keeps running
+        self._show_toast(f"✔ La conversión se ha completado correctamente.{detail}")
         # Reset the UI after a short delay to show the success message
         self.after(2000, self.reset_ui_state)
     
+    def _show_toast(self, text: str, duration_ms: int = 6000):
+        """Show a transient notification over the top of the window"""
+        if self._toast is None:
+            self._toast = ctk.CTkLabel(
+                self, text="", corner_radius=8, fg_color="#10B981", text_color="#FFFFFF",
+                font=ctk.CTkFont(family="Segoe UI", size=13, weight="bold"),
+                padx=16, pady=8
+            )
+        if self._toast_job is not None:
+            self.after_cancel(self._toast_job)
+        self._toast.configure(text=text)
+        self._toast.place(relx=0.5, y=16, anchor="n")
+        self._toast.lift()
+        self._toast_job = self.after(duration_ms, self._hide_toast)
+    
+    def _hide_toast(self):
+        """Auto-hide callback for _show_toast"""
+        self._toast_job = None
+        self._toast.place_forget()
+    
     def on_conversion_error(self, error_msg: str):
         """Handle conversion errors"""
-        self.status_var.set("Error en la conversión")
+        self._cancel_progress_flush()
+        self._clear_cancel_confirm()
+        self._set_status("Error en la conversión")
+        self.is_processing = False
+        self.update_ui_state()
         messagebox.showerror("Error", 
             f"Ocurrió un error durante la conversión:\n{error_msg}")
         self.progress_bar.set(0)
@@ -1663,11 +1793,12 @@ class TextToSpeechApp(ctk.CTk):
                     messagebox.showinfo("Descarga Exitosa", "El modelo y las voces de Kokoro se han descargado correctamente.")
                 self.after(0, success_ui)
             except Exception as e:
-                def error_ui():
+                # Bind the message now: 'e' is unbound once the except block ends
+                def error_ui(err=str(e)):
                     self.kokoro_dl_bar.grid_remove()
                     self.kokoro_dl_btn.configure(state=tk.NORMAL)
                     self._check_kokoro_status()
-                    messagebox.showerror("Error", f"Fallo al descargar el modelo de Kokoro: {e}")
+                    messagebox.showerror("Error", f"Fallo al descargar el modelo de Kokoro: {err}")
                 self.after(0, error_ui)
 
         threading.Thread(target=run_dl, daemon=True).start()
@@ -3,13 +3,10 @@ Gestor de Kokoro TTS (offline con ONNX).
 Maneja la detección de dependencias, descarga de modelos, inicialización de kokoro-onnx y síntesis.
 """
 import os
-import sys
 import urllib.request
 import threading
 from pathlib import Path
 from typing import List, Dict, Optional, Callable
-import soundfile as sf
-import numpy as np
 
 # Directorio local donde se guardan los modelos Kokoro
 MODELS_DIR = Path(__file__).parent.parent.parent / "kokoro_models"
@@ -198,6 +195,10 @@ class KokoroVoiceManager:
         clean_text = text.strip()
         print(f"Sintetizando con Kokoro (Voz: {voice_id}, Lang: {lang}, Texto: {clean_text[:50]}...)")
 
+        # Importados aquí para no cargar numpy/soundfile al arrancar la aplicación
+        import numpy as np
+        import soundfile as sf
+
         try:
             # Generar audio con kokoro-onnx (retorna numpy array y sample rate) de forma segura frente a concurrencia
             with self._lock:
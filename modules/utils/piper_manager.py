@@ -2,7 +2,6 @@
 Gestor de voces Piper TTS (offline).
 Maneja la descarga, caché y uso de modelos .onnx de Piper.
 """
-import asyncio
 import json
 import os
 import sys
@@ -1,90 +1,172 @@
 import asyncio
-from typing import List, Dict, Optional, Set
-import edge_tts
+import json
+import os
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple
+
+# On-disk copy of the processed edge-tts voice list, so startup doesn't need the network
+VOICES_CACHE_FILE = Path.home() / ".cache" / "epub_to_mp3_tts_ege" / "voices.json"
+VOICES_CACHE_TTL = 7 * 24 * 3600  # seconds
+# Optional snapshot shipped with the app (same format as the cache), used until the first fetch succeeds
+BUNDLED_VOICES_FILE = Path(__file__).with_name("voices.json")
+
+@lru_cache(maxsize=None)
+def _edge_tts_version() -> str:
+    """Installed edge-tts version, read from package metadata so startup doesn't import edge_tts"""
+    try:
+        from importlib.metadata import version
+        return version('edge-tts')
+    except Exception:
+        import edge_tts
+        return getattr(edge_tts, '__version__', '')
 
 class VoiceManager:
     def __init__(self):
         self.voices: List[Dict] = []
         self.filtered_voices: List[Dict] = []
+        self._names: Tuple[str, ...] = ()
+        # (language, gender) -> matching voices / names; None means "any"
+        self._voices_by_filter: Dict[Tuple[Optional[str], Optional[str]], List[Dict]] = {}
+        self._names_by_filter: Dict[Tuple[Optional[str], Optional[str]], Tuple[str, ...]] = {}
+        self._genders_by_filter: Dict[Tuple[Optional[str], Optional[str]], Tuple[str, ...]] = {}
+        self._by_name: Dict[str, Dict] = {}
         self.loaded = False
         self.supported_languages = {'es', 'en'}  # Spanish and English only
+        self._lang_prefixes = tuple(f"{lang}-" for lang in self.supported_languages)
         
-    async def load_voices_async(self):
-        """Load available voices asynchronously with language and gender filtering"""
-        if not self.loaded:
+    async def load_voices_async(self, refresh: bool = False):
+        """Load available voices asynchronously with language and gender filtering
+
+        With refresh=True the list is fetched again even if a cached one is already loaded.
+        """
+        if refresh or not self.loaded:
             try:
+                # Imported here: edge_tts pulls in aiohttp and friends, which startup doesn't need
+                import edge_tts
                 all_voices = await edge_tts.list_voices()
                 
-                # Filter voices by supported languages and add gender info
-                self.voices = []
-                for voice in all_voices:
-                    # Extract language code (e.g., 'es-ES' -> 'es')
-                    lang_code = voice['ShortName'].split('-')[0].lower()
-                    
-                    # Only keep Spanish and English voices
-                    if lang_code in self.supported_languages:
-                        # Add gender information
-                        voice_data = {
-                            'Name': voice['Name'],
-                            'ShortName': voice['ShortName'],
-                            'Gender': voice.get('Gender', 'Unknown').lower(),
-                            'Language': lang_code
-                        }
-                        self.voices.append(voice_data)
-                
-                # Apply default filters
-                self._filter_voices()
-                self.loaded = True
+                # Keep the (synchronous) post-processing off the shared event loop
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(None, self._load_voices_sync, all_voices)
                 
             except Exception as e:
+                # Offline: a stale cached list (or the bundled snapshot) is better than no voices at all
+                if self.loaded or self.load_cached_voices(max_age=None) or self.load_bundled_voices():
+                    print(f"Error loading voices, using cached list: {e}")
+                    return
                 print(f"Error loading voices: {e}")
                 raise
     
-    def _filter_voices(self, 
-                      languages: Optional[Set[str]] = None,
-                      gender: Optional[str] = None):
-        """Filter voices by language and gender"""
-        self.filtered_voices = []
+    def load_cached_voices(self, max_age: Optional[float] = VOICES_CACHE_TTL,
+                           cache_file: Path = VOICES_CACHE_FILE) -> bool:
+        """Load voices from the disk cache; returns False if missing or older than max_age seconds"""
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
         
-        # If no languages specified, use all supported languages
-        if not languages:
-            languages = self.supported_languages
+        if max_age is not None and time.time() - data.get('saved_at', 0) > max_age:
+            return False
+        # An edge-tts upgrade may change the voice catalogue; refetch rather than trust the cache
+        if max_age is not None and data.get('edge_tts_version') != _edge_tts_version():
+            return False
+        voices = data.get('voices')
+        if not voices:
+            return False
         
-        # First filter by exact language match (e.g., 'es' matches 'es-ES', 'es-MX')
+        self.voices = voices
+        self._build_index()
+        self.update_filters()
+        self.loaded = True
+        return True
+    
+    def load_bundled_voices(self) -> bool:
+        """Load the voice snapshot shipped next to this module, if there is one"""
+        return self.load_cached_voices(max_age=None, cache_file=BUNDLED_VOICES_FILE)
+    
+    def _save_voices_cache(self):
+        """Persist the processed voice list for the next launch"""
+        try:
+            VOICES_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = VOICES_CACHE_FILE.with_name(VOICES_CACHE_FILE.name + ".part")
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({'saved_at': time.time(), 'edge_tts_version': _edge_tts_version(), 'voices': self.voices}, f)
+            os.replace(tmp_file, VOICES_CACHE_FILE)
+        except OSError as e:
+            print(f"Warning: Could not save voices cache: {e}")
+    
+    def _load_voices_sync(self, all_voices: List[Dict]):
+        """Keep supported voices, add gender/language info and apply default filters"""
+        # Filter voices by supported languages and add gender info
+        voices = []
+        for voice in all_voices:
+            # Only keep Spanish and English voices (e.g., 'es-ES-...' -> 'es')
+            short_name = voice['ShortName'].lower()
+            if short_name.startswith(self._lang_prefixes):
+                lang_code = short_name[:short_name.index('-')]
+                # Add gender information
+                voice_data = {
+                    'Name': voice['Name'],
+                    'ShortName': voice['ShortName'],
+                    'Gender': voice.get('Gender', 'Unknown').lower(),
+                    'Language': lang_code
+                }
+                voices.append(voice_data)
+        # Sort once here; filters keep this order, so the dropdowns never need to sort
+        voices.sort(key=lambda v: v['Name'])
+        self.voices = voices
+        self._build_index()
+        
+        # Apply default filters
+        self.update_filters()
+        self.loaded = True
+        self._save_voices_cache()
+    
+    def _build_index(self):
+        """Precompute the voices for every (language, gender) filter in one pass"""
+        voices_by_filter: Dict[Tuple[Optional[str], Optional[str]], List[Dict]] = {}
         for voice in self.voices:
-            voice_lang = voice['ShortName'].split('-')[0].lower()
-            if voice_lang in languages:
-                self.filtered_voices.append(voice)
+            lang, gender = voice['Language'], voice['Gender']
+            for key in ((lang, None), (lang, gender), (None, None), (None, gender)):
+                voices_by_filter.setdefault(key, []).append(voice)
         
-        # Then apply gender filter if specified
-        if gender and gender.lower() in ['male', 'female']:
-            gender = gender.lower()
-            self.filtered_voices = [
-                v for v in self.filtered_voices
-                if v['Gender'].lower() == gender
-            ]
+        self._voices_by_filter = voices_by_filter
+        self._names_by_filter = {
+            key: tuple(v['Name'] for v in voices) for key, voices in voices_by_filter.items()
+        }
+        self._genders_by_filter = {
+            key: self._gender_options(voices) for key, voices in voices_by_filter.items()
+        }
+        self._by_name = {v['Name']: v for v in self.voices}
+    
+    @staticmethod
+    def _gender_options(voices: List[Dict]) -> Tuple[str, ...]:
+        """Sorted, capitalised male/female genders present in voices"""
+        present = {v['Gender'] for v in voices}
+        return tuple(g.capitalize() for g in ('female', 'male') if g in present)
     
-    def get_voice_names(self) -> List[str]:
-        """Get list of available voice names"""
-        return [v['Name'] for v in self.filtered_voices]
+    def get_voice_names(self) -> Tuple[str, ...]:
+        """Get the (cached) names of the currently filtered voices"""
+        return self._names
     
     def get_voice_by_name(self, name: str) -> Optional[Dict]:
-        """Get voice details by name"""
-        for voice in self.voices:  # Search in all voices, not just filtered
-            if voice['Name'] == name:
-                return voice
-        return None
+        """Get voice details by name (searches all voices, not just filtered)"""
+        return self._by_name.get(name)
     
-    def get_available_genders(self) -> List[str]:
-        """Get list of available genders in filtered voices"""
-        genders = set()
-        for voice in self.filtered_voices:
-            if voice['Gender'] in ['male', 'female']:
-                genders.add(voice['Gender'].capitalize())
-        return sorted(list(genders))
+    def available_genders_for(self, language: Optional[str] = None) -> List[str]:
+        """Capitalised genders offered for a language (all languages if None), without touching the filters"""
+        return list(self._genders_by_filter.get((language or None, None), ()))
     
     def update_filters(self, language: Optional[str] = None, 
                       gender: Optional[str] = None):
         """Update voice filters and refresh the filtered list"""
-        languages = {language} if language else self.supported_languages
-        self._filter_voices(languages, gender.lower() if gender else None)
+        gender = gender.lower() if gender else None
+        if gender not in ('male', 'female'):
+            gender = None
+        # Every combination was precomputed at load time, so this is a lookup
+        key = (language or None, gender)
+        self.filtered_voices = self._voices_by_filter.get(key, [])
+        self._names = self._names_by_filter.get(key, ())